@@ -9,12 +9,15 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+_TRUTHY_ENV_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
 def env_bool(key: str, default: bool = False) -> bool:
     """
     Convert environment variable to boolean safely.
     Accepts: true/false, 1/0, yes/no, on/off (case-insensitive).
     """
-    return os.getenv(key, str(default)).strip().lower() in ("true", "1", "yes", "on")
+    return os.getenv(key, str(default)).strip().lower() in _TRUTHY_ENV_VALUES
 
 
 def env_csv(key: str, default: str = "") -> list[str]:
@@ -162,6 +165,20 @@ WSGI_APPLICATION = "Skillbite.wsgi.application"
 # ==================================================
 # قاعدة البيانات
 # ==================================================
+# SQLite (التطوير): WAL يسمح بالقراءة أثناء الكتابة، و mmap + كاش أكبر
+# يقللان قراءات القرص عند تصفح القوائم الطويلة في لوحة الأدمن.
+SQLITE_OPTIONS = {
+    "init_command": (
+        "PRAGMA journal_mode=WAL;"
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA mmap_size=268435456;"
+        "PRAGMA cache_size=-65536;"
+        "PRAGMA temp_store=MEMORY;"
+    ),
+    "transaction_mode": "IMMEDIATE",
+}
+
+
 def build_database_config_from_url(database_url: str) -> dict:
     parsed = urlparse(database_url)
     engine_map = {
@@ -179,6 +196,7 @@ def build_database_config_from_url(database_url: str) -> dict:
         return {
             "ENGINE": engine,
             "NAME": db_path,
+            "OPTIONS": dict(SQLITE_OPTIONS),
         }
 
     query = parse_qs(parsed.query)
@@ -228,6 +246,7 @@ else:
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": BASE_DIR / "db.sqlite3",
+            "OPTIONS": dict(SQLITE_OPTIONS),
         }
     }
 
@@ -11,11 +11,11 @@ urlpatterns = [
     path('media/scorm/<path:filename>', scorm_zip_download_view, name='scorm_zip_download'),
     path('api/mobile/v1/', include('accounts.api_urls')),
 
-    # الشاشة الرئيسية (accounts هو المسؤول)
-    path('', include('accounts.urls')),
-
     # لوحة تحكم الأدمن
     path('admin/', admin.site.urls),
+
+    # الشاشة الرئيسية (accounts هو المسؤول)
+    path('', include('accounts.urls')),
 ]
 
 
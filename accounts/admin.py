@@ -3,11 +3,24 @@ from django.contrib import admin
 from .models import BusinessTenant, EmployeeProfile, JobTitle
 
 
+class JobTitleListFilter(admin.RelatedFieldListFilter):
+    # JobTitle.__str__ includes the business name, so the sidebar choices join
+    # the business instead of loading it once per job title.
+    def field_choices(self, field, request, model_admin):
+        ordering = self.field_admin_ordering(field, request, model_admin)
+        job_titles = JobTitle.objects.select_related('business')
+        if ordering:
+            job_titles = job_titles.order_by(*ordering)
+        return [(job_title.pk, str(job_title)) for job_title in job_titles]
+
+
 @admin.register(BusinessTenant)
 class BusinessTenantAdmin(admin.ModelAdmin):
     list_display = ('name', 'owner', 'industry', 'is_active', 'created_at')
+    list_select_related = ('owner',)
     search_fields = ('name', 'owner__username', 'owner__email', 'slug')
     list_filter = ('is_active', 'industry')
+    autocomplete_fields = ('owner',)
 
 
 @admin.register(JobTitle)
@@ -15,10 +28,17 @@ class JobTitleAdmin(admin.ModelAdmin):
     list_display = ('name', 'business', 'created_at')
     search_fields = ('name', 'business__name')
     list_filter = ('business',)
+    autocomplete_fields = ('business',)
+
+    def get_queryset(self, request):
+        # JobTitle.__str__ includes the business name, which autocomplete results render too.
+        return super().get_queryset(request).select_related('business')
 
 
 @admin.register(EmployeeProfile)
 class EmployeeProfileAdmin(admin.ModelAdmin):
     list_display = ('user', 'business', 'job_title', 'is_active', 'created_by', 'created_at')
+    list_select_related = ('user', 'business', 'job_title__business', 'created_by')
     search_fields = ('user__username', 'user__email', 'business__name', 'job_title__name')
-    list_filter = ('business', 'job_title', 'is_active')
+    list_filter = ('business', ('job_title', JobTitleListFilter), 'is_active')
+    autocomplete_fields = ('user', 'business', 'job_title', 'created_by')
@@ -1,24 +1,19 @@
 from django.db.models import Q
 
 from .models import (
-    BusinessTenant,
-    EmployeeProfile,
     PrivateChatMessage,
     TeamChatMessage,
 )
+from .views import _get_employee_profile, _get_owned_business
 
 
 def _chat_business_and_role(user):
     if not getattr(user, 'is_authenticated', False):
         return None, None
-    business = BusinessTenant.objects.filter(owner=user, is_active=True).first()
+    business = _get_owned_business(user)
     if business is not None:
         return business, 'business_owner'
-    employee_profile = (
-        EmployeeProfile.objects.select_related('business')
-        .filter(user=user, is_active=True, business__is_active=True)
-        .first()
-    )
+    employee_profile = _get_employee_profile(user)
     if employee_profile is not None:
         return employee_profile.business, 'employee'
     return None, None
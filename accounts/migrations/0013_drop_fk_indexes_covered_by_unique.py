@@ -0,0 +1,34 @@
+# Generated by Django 6.0.1 on 2026-10-15 13:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_teamchatreadreceipt_privatechatthread_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='jobtitle',
+            name='business',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='job_titles', to='accounts.businesstenant', verbose_name='Business'),
+        ),
+        migrations.AlterField(
+            model_name='privatechatreadreceipt',
+            name='message',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='read_receipts', to='accounts.privatechatmessage', verbose_name='Message'),
+        ),
+        migrations.AlterField(
+            model_name='privatechatthread',
+            name='business',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='private_chat_threads', to='accounts.businesstenant', verbose_name='Business'),
+        ),
+        migrations.AlterField(
+            model_name='teamchatreadreceipt',
+            name='message',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='read_receipts', to='accounts.teamchatmessage', verbose_name='Message'),
+        ),
+    ]
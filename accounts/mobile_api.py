@@ -21,7 +21,6 @@ from training.models import (
     SOPChecklist,
     SOPChecklistCompletion,
     SOPChecklistItem,
-    SOPChecklistItemCompletion,
 )
 
 from .forms import CourseContentItemForm, CourseForm, JobTitleForm, SOPChecklistAssignmentRuleForm, SOPChecklistForm
@@ -41,7 +40,7 @@ from .views import (
     PublicRegisterForm,
     _active_chat_participants,
     _accessible_business_courses_queryset,
-    _assign_course_to_employee,
+    _assign_course_to_employees,
     _assigned_checklists_queryset,
     _business_owner_dashboard_context,
     _course_card_defaults,
@@ -55,6 +54,7 @@ from .views import (
     _get_owned_business,
     _is_business_owner,
     _is_employee,
+    _mark_checklist_items_checked,
     _mark_private_chat_messages_read,
     _mark_team_chat_messages_read,
     _private_chat_conversation_summaries,
@@ -935,12 +935,7 @@ def employee_checklist_complete_api_view(request, checklist_id: int):
     if not created:
         completion.notes = (payload.get('notes') or '').strip()
         completion.save(update_fields=['notes'])
-    for item in items:
-        SOPChecklistItemCompletion.objects.update_or_create(
-            completion=completion,
-            item=item,
-            defaults={'is_checked': True},
-        )
+    _mark_checklist_items_checked(completion, items)
     return _json_success({'checklist': _serialize_checklist(checklist, completion=completion, include_items=True)})
 
 
@@ -1279,19 +1274,12 @@ def owner_assign_course_api_view(request, course_id: int):
     )
     if not employees:
         return _json_error('No valid employees were selected.', status=404, code='employees_not_found')
-    created_count = 0
-    duplicate_count = 0
-    for employee in employees:
-        created, _error = _assign_course_to_employee(
-            business=business,
-            course=course,
-            employee_profile=employee,
-            assigned_by=auth_token.user,
-        )
-        if created:
-            created_count += 1
-        else:
-            duplicate_count += 1
+    created_count, duplicate_count = _assign_course_to_employees(
+        business=business,
+        course=course,
+        employee_profiles=employees,
+        assigned_by=auth_token.user,
+    )
     return _json_success(
         {
             'assignment_summary': {
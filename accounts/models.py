@@ -1,5 +1,6 @@
 import hashlib
 import secrets
+from datetime import timedelta
 
 from django.conf import settings
 from django.db import models
@@ -8,6 +9,7 @@ from django.utils.text import slugify
 
 
 User = settings.AUTH_USER_MODEL
+MOBILE_TOKEN_TOUCH_INTERVAL = timedelta(minutes=1)
 
 
 class BusinessTenant(models.Model):
@@ -65,6 +67,7 @@ class JobTitle(models.Model):
         BusinessTenant,
         on_delete=models.CASCADE,
         related_name='job_titles',
+        db_index=False,
         verbose_name='Business',
     )
     name = models.CharField(
@@ -172,6 +175,7 @@ class TeamChatReadReceipt(models.Model):
         TeamChatMessage,
         on_delete=models.CASCADE,
         related_name='read_receipts',
+        db_index=False,
         verbose_name='Message',
     )
     user = models.ForeignKey(
@@ -202,6 +206,7 @@ class PrivateChatThread(models.Model):
         BusinessTenant,
         on_delete=models.CASCADE,
         related_name='private_chat_threads',
+        db_index=False,
         verbose_name='Business',
     )
     user_one = models.ForeignKey(
@@ -277,6 +282,7 @@ class PrivateChatReadReceipt(models.Model):
         PrivateChatMessage,
         on_delete=models.CASCADE,
         related_name='read_receipts',
+        db_index=False,
         verbose_name='Message',
     )
     user = models.ForeignKey(
@@ -375,7 +381,10 @@ class MobileAuthToken(models.Model):
         )
 
     def touch(self) -> None:
-        self.last_used_at = timezone.now()
+        now = timezone.now()
+        if self.last_used_at and now - self.last_used_at < MOBILE_TOKEN_TOUCH_INTERVAL:
+            return
+        self.last_used_at = now
         self.save(update_fields=['last_used_at'])
 
     def revoke(self) -> None:
@@ -1,25 +1,32 @@
 import json
 import os
+from datetime import timedelta
 from unittest.mock import PropertyMock, patch
 
 from django.conf import settings
+from django.contrib import admin
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from django.core.management import call_command
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import Client, TestCase, override_settings
-from django.urls import reverse
+from django.db import connection
+from django.test import Client, RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import ResolverMatch, reverse
 from django.utils import timezone
 
+from accounts.context_processors import chat_navigation
 from accounts.models import (
     BusinessTenant,
     EmployeeProfile,
     JobTitle,
+    MobileAuthToken,
     PrivateChatMessage,
     PrivateChatThread,
     TeamChatMessage,
     TeamChatReadReceipt,
 )
+from accounts.views import _get_employee_profile, _get_owned_business
 from certification.models import ScormCertificate
 from training.models import (
     Course,
@@ -213,6 +220,23 @@ class MultiTenantFlowTests(TestCase):
             2,
         )
 
+    def test_resubmitting_daily_sop_checklist_updates_existing_item_rows(self):
+        employee_user = User.objects.create_user(username='employee3b', password='pass12345')
+        EmployeeProfile.objects.create(user=employee_user, business=self.business, job_title=self.job_title, created_by=self.owner)
+        completion = SOPChecklistCompletion.objects.create(business=self.business, checklist=self.checklist, employee=employee_user)
+        SOPChecklistItemCompletion.objects.create(completion=completion, item=self.checklist_item_1, is_checked=False)
+
+        self.client.login(username='employee3b', password='pass12345')
+        response = self.client.post(
+            reverse('employee_checklist_complete', args=[self.checklist.id]),
+            {'item_ids': [self.checklist_item_1.id, self.checklist_item_2.id]},
+        )
+        self.assertRedirects(response, reverse('employee_checklists'))
+
+        item_completions = SOPChecklistItemCompletion.objects.filter(completion=completion)
+        self.assertEqual(item_completions.count(), 2)
+        self.assertFalse(item_completions.filter(is_checked=False).exists())
+
     def test_owner_navigation_pages_render(self):
         self.client.login(username='owner', password='pass12345')
         for route_name in (
@@ -492,6 +516,28 @@ class MultiTenantFlowTests(TestCase):
         self.assertRedirects(response, reverse('business_owner_course_view', args=[manual_course.id]))
         self.assertEqual(CourseAssignment.objects.filter(course=manual_course).count(), 2)
 
+    def test_owner_bulk_assign_skips_employees_who_already_have_the_course(self):
+        self.client.login(username='owner', password='pass12345')
+        manual_course = Course.objects.create(
+            business=self.business,
+            title='Opening Duties',
+            estimated_minutes=10,
+            created_by=self.owner,
+        )
+        employee_user_1 = User.objects.create_user(username='bulk_emp_1', password='pass12345')
+        employee_user_2 = User.objects.create_user(username='bulk_emp_2', password='pass12345')
+        EmployeeProfile.objects.create(user=employee_user_1, business=self.business, created_by=self.owner)
+        EmployeeProfile.objects.create(user=employee_user_2, business=self.business, created_by=self.owner)
+        CourseAssignment.objects.create(business=self.business, course=manual_course, employee=employee_user_1, assigned_by=self.owner)
+
+        response = self.client.post(
+            reverse('business_owner_course_assign_employees', args=[manual_course.id]),
+            {'assign_scope': 'all'},
+            follow=True,
+        )
+        self.assertContains(response, 'إلى 1 موظف/موظفين. وتم ترك 1 كما هي')
+        self.assertEqual(CourseAssignment.objects.filter(course=manual_course).count(), 2)
+
     def test_owner_dashboard_assign_modal_marks_already_assigned_courses_for_employee(self):
         self.client.login(username='owner', password='pass12345')
         employee_user = User.objects.create_user(username='dashboard_emp', password='pass12345')
@@ -1254,6 +1300,60 @@ class MultiTenantFlowTests(TestCase):
         self.assertEqual(Course.objects.filter(business=self.business).count(), 0)
         self.assertEqual(Course.objects.filter(business=second_business).count(), 0)
 
+    def test_partial_certificate_save_backfills_missing_expiry(self):
+        employee_user = User.objects.create_user(username='employee_legacy_certificate', password='pass12345')
+        certificate = ScormCertificate.objects.create(
+            owner=employee_user,
+            course_name=self.course.title,
+            scorm_filename=f'course_exam_{self.course.id}',
+            verification_code='LEGACY-CERT-1',
+        )
+        ScormCertificate.objects.filter(pk=certificate.pk).update(expires_at=None)
+        certificate = ScormCertificate.objects.get(pk=certificate.pk)
+
+        certificate.pdf_file.name = 'certificates/legacy.pdf'
+        certificate.save(update_fields=['pdf_file'])
+
+        certificate.refresh_from_db()
+        self.assertEqual(certificate.pdf_file.name, 'certificates/legacy.pdf')
+        self.assertEqual(certificate.expires_at, ScormCertificate._add_years(certificate.issued_at, 3))
+
+    @staticmethod
+    def _count_queries(queries, sql_fragment: str) -> int:
+        return sum(1 for query in queries.captured_queries if sql_fragment in query['sql'])
+
+    def test_owner_page_looks_up_owned_business_once_per_request(self):
+        self.client.login(username='owner', password='pass12345')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('business_owner_dashboard'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._count_queries(queries, '"accounts_businesstenant"."owner_id" ='), 1)
+
+    def test_employee_page_looks_up_employee_profile_once_per_request(self):
+        employee_user = User.objects.create_user(username='employee_memo', password='pass12345')
+        EmployeeProfile.objects.create(user=employee_user, business=self.business, job_title=self.job_title, created_by=self.owner)
+
+        self.client.login(username='employee_memo', password='pass12345')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('employee_checklists'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._count_queries(queries, '"accounts_employeeprofile"."user_id" ='), 1)
+
+    def test_chat_context_processor_reuses_the_memoized_lookups(self):
+        employee_user = User.objects.create_user(username='employee_memo_nav', password='pass12345')
+        EmployeeProfile.objects.create(user=employee_user, business=self.business, job_title=self.job_title, created_by=self.owner)
+        for user, url_name in ((self.owner, 'business_owner_chat'), (employee_user, 'employee_chat')):
+            with self.subTest(user=user.username):
+                user = User.objects.get(pk=user.pk)
+                _get_owned_business(user)
+                _get_employee_profile(user)
+                request = RequestFactory().get('/')
+                request.user = user
+                # Only the team and private unread counts are left to run.
+                with self.assertNumQueries(2):
+                    context = chat_navigation(request)
+                self.assertEqual(context['chat_nav_url_name'], url_name)
+
 
 class SuperAdminFlowTests(TestCase):
     def setUp(self):
@@ -1640,6 +1740,157 @@ class SuperAdminFlowTests(TestCase):
         self.assertTrue(self.super_admin.is_superuser)
 
 
+class AdminQueryCountTests(TestCase):
+    def setUp(self):
+        self.super_admin = User.objects.create_user(
+            username='admin_root',
+            password='pass12345',
+            is_staff=True,
+            is_superuser=True,
+        )
+        self.client.login(username='admin_root', password='pass12345')
+
+    def _create_business_rows(self, prefix: str, count: int) -> None:
+        for index in range(count):
+            owner = User.objects.create_user(username=f'{prefix}_owner_{index}', password='pass12345')
+            employee = User.objects.create_user(username=f'{prefix}_employee_{index}', password='pass12345')
+            business = BusinessTenant.objects.create(owner=owner, name=f'{prefix} Business {index}')
+            job_title = JobTitle.objects.create(business=business, name='Barista')
+            EmployeeProfile.objects.create(user=employee, business=business, job_title=job_title, created_by=owner)
+            course = Course.objects.create(business=business, title=f'{prefix} Course {index}', created_by=owner)
+            CourseContentItem.objects.create(course=course, title='Intro', order=1)
+            CourseContentItem.objects.create(course=course, title='Wrap up', order=2)
+            CourseAssignment.objects.create(business=business, course=course, employee=employee, assigned_by=owner)
+            checklist = SOPChecklist.objects.create(business=business, title=f'{prefix} Checklist {index}', created_by=owner)
+            item = SOPChecklistItem.objects.create(checklist=checklist, title='Sanitize counters', order=1)
+            completion = SOPChecklistCompletion.objects.create(business=business, checklist=checklist, employee=employee)
+            SOPChecklistItemCompletion.objects.create(completion=completion, item=item, is_checked=True)
+
+    def _query_count(self, url: str) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_training_changelists_do_not_query_per_row(self):
+        urls = [
+            reverse(f'admin:training_{model._meta.model_name}_changelist')
+            for model in admin.site._registry
+            if model._meta.app_label == 'training'
+        ]
+        self.assertEqual(len(urls), 7)
+        self._create_business_rows('first', 1)
+        baseline = {url: self._query_count(url) for url in urls}
+        self._create_business_rows('second', 3)
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertEqual(self._query_count(url), baseline[url])
+
+    def test_accounts_changelists_and_autocomplete_do_not_query_per_row(self):
+        urls = [
+            reverse('admin:accounts_businesstenant_changelist'),
+            reverse('admin:accounts_jobtitle_changelist'),
+            reverse('admin:accounts_employeeprofile_changelist'),
+            reverse('admin:certification_scormcertificate_changelist'),
+            reverse('admin:autocomplete') + '?app_label=accounts&model_name=employeeprofile&field_name=job_title',
+            reverse('admin:autocomplete') + '?app_label=training&model_name=sopchecklistitemcompletion&field_name=completion',
+        ]
+        self._create_business_rows('first', 1)
+        baseline = {url: self._query_count(url) for url in urls}
+        self._create_business_rows('second', 3)
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertEqual(self._query_count(url), baseline[url])
+
+    def test_training_changelist_search_matches_business_name_substring(self):
+        self._create_business_rows('search', 2)
+        response = self.client.get(reverse('admin:training_course_changelist'), {'q': 'business 1'})
+        self.assertContains(response, 'search Course 1')
+        self.assertNotContains(response, 'search Course 0')
+
+    def test_title_autocomplete_searches_only_the_title_prefix(self):
+        self._create_business_rows('lookup', 2)
+        autocomplete_url = reverse('admin:autocomplete')
+        urls = {
+            'lookup Course 1': f'{autocomplete_url}?app_label=training&model_name=coursecontentitem&field_name=course&term=LOOKUP+course+1',
+            'lookup Checklist 1': f'{autocomplete_url}?app_label=training&model_name=sopchecklistassignmentrule&field_name=checklist&term=LOOKUP+checklist+1',
+        }
+        for title, url in urls.items():
+            with self.subTest(title=title):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url)
+                self.assertEqual([result['text'] for result in response.json()['results']], [title])
+                search_sql = [query['sql'] for query in queries if 'LIKE' in query['sql']]
+                self.assertTrue(search_sql)
+                for sql in search_sql:
+                    self.assertNotIn(' OR ', sql)
+                    self.assertNotIn('accounts_businesstenant', sql)
+
+    def test_accounts_changelist_search_matches_partial_email(self):
+        self._create_business_rows('email', 1)
+        employee = User.objects.get(username='email_employee_0')
+        employee.email = 'barista.lee@example.com'
+        employee.save(update_fields=['email'])
+        response = self.client.get(reverse('admin:accounts_employeeprofile_changelist'), {'q': 'barista.lee'})
+        self.assertContains(response, 'email_employee_0')
+
+    def test_change_forms_use_autocomplete_widgets_for_foreign_keys(self):
+        self._create_business_rows('widget', 3)
+        course = Course.objects.get(title='widget Course 0')
+        response = self.client.get(reverse('admin:training_course_change', args=[course.id]))
+        self.assertContains(response, 'admin-autocomplete')
+        self.assertNotContains(response, 'widget Business 2')
+        self.assertNotContains(response, 'widget_employee_2')
+        self.assertContains(response, '<select name="exam_template"')
+
+        item_completion = SOPChecklistItemCompletion.objects.filter(item__checklist__title='widget Checklist 0').get()
+        response = self.client.get(reverse('admin:training_sopchecklistitemcompletion_change', args=[item_completion.id]))
+        self.assertContains(response, '<select name="item"')
+        self.assertContains(response, 'widget Checklist 2 - Sanitize counters')
+
+    def test_change_forms_do_not_query_per_inline_row_or_choice(self):
+        self._create_business_rows('inline', 1)
+        course = Course.objects.get(title='inline Course 0')
+        checklist = SOPChecklist.objects.get(title='inline Checklist 0')
+        item_completion = SOPChecklistItemCompletion.objects.get(item__checklist=checklist)
+        urls = [
+            reverse('admin:training_course_change', args=[course.id]),
+            reverse('admin:training_sopchecklist_change', args=[checklist.id]),
+            reverse('admin:training_sopchecklistitemcompletion_change', args=[item_completion.id]),
+        ]
+        # Warm the content type cache used by the change form before measuring.
+        for url in urls:
+            self._query_count(url)
+        baseline = {url: self._query_count(url) for url in urls}
+        for order in range(3, 6):
+            CourseContentItem.objects.create(course=course, title=f'Part {order}', order=order)
+            SOPChecklistItem.objects.create(checklist=checklist, title=f'Step {order}', order=order)
+        for url in urls:
+            with self.subTest(url=url):
+                self.assertEqual(self._query_count(url), baseline[url])
+
+    def test_changelist_skips_large_text_columns_but_change_form_loads_them(self):
+        self._create_business_rows('defer', 1)
+        course = Course.objects.get(title='defer Course 0')
+        course.description = 'Long onboarding description'
+        course.save(update_fields=['description'])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('admin:training_course_changelist'))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(any('"training_course"."description"' in query['sql'] for query in queries))
+
+        response = self.client.get(reverse('admin:training_course_change', args=[course.id]))
+        self.assertContains(response, 'Long onboarding description')
+
+    def test_deferred_fields_are_kept_on_unnamed_admin_urls(self):
+        request = RequestFactory().get('/admin/training/course/export/')
+        request.user = self.super_admin
+        request.resolver_match = ResolverMatch(lambda request: None, (), {})
+        queryset = admin.site._registry[Course].get_queryset(request)
+        self.assertEqual(queryset.query.deferred_loading, (frozenset(), True))
+
+
 class LoginSecurityTests(TestCase):
     def setUp(self):
         cache.clear()
@@ -1779,6 +2030,22 @@ class MobileApiTests(TestCase):
         self.assertEqual(payload['user']['role'], 'business_owner')
         self.assertEqual(payload['user']['business']['name'], 'Mobile Cafe')
 
+    def test_mobile_token_last_used_is_written_at_most_once_per_interval(self):
+        token = self._mobile_login('mobile_owner', 'pass12345')
+        auth_token = MobileAuthToken.objects.get(user=self.owner)
+        recent = timezone.now() - timedelta(seconds=10)
+        MobileAuthToken.objects.filter(id=auth_token.id).update(last_used_at=recent)
+
+        self.client.get(reverse('mobile_me'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        auth_token.refresh_from_db()
+        self.assertEqual(auth_token.last_used_at, recent)
+
+        stale = timezone.now() - timedelta(minutes=5)
+        MobileAuthToken.objects.filter(id=auth_token.id).update(last_used_at=stale)
+        self.client.get(reverse('mobile_me'), HTTP_AUTHORIZATION=f'Bearer {token}')
+        auth_token.refresh_from_db()
+        self.assertGreater(auth_token.last_used_at, stale)
+
     def test_employee_mobile_course_flow_can_complete_without_exam(self):
         token = self._mobile_login('mobile_employee', 'pass12345')
         detail_response = self.client.get(
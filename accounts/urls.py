@@ -1,4 +1,4 @@
-from django.urls import path
+from django.urls import include, path
 
 from .views import (
     business_owner_checklist_assignment_rule_create_action,
@@ -86,89 +86,105 @@ from .views import (
 )
 
 
+super_admin_patterns = [
+    path('dashboard/', super_admin_dashboard_view, name='super_admin_dashboard'),
+    path('businesses/', super_admin_businesses_view, name='super_admin_businesses'),
+    path('businesses/new/', super_admin_business_create_view, name='super_admin_business_create_view'),
+    path('businesses/create/', super_admin_business_create_action, name='super_admin_business_create'),
+    path('businesses/<int:business_id>/toggle/', super_admin_business_toggle_action, name='super_admin_business_toggle'),
+    path('users/', super_admin_users_view, name='super_admin_users'),
+    path('users/new/', super_admin_user_create_view, name='super_admin_user_create_view'),
+    path('users/grant-role/', super_admin_user_role_grant_view, name='super_admin_user_role_grant_view'),
+    path('users/create/', super_admin_user_create_action, name='super_admin_user_create'),
+    path('users/grant-role/submit/', super_admin_user_role_grant_action, name='super_admin_user_role_grant'),
+    path('users/<int:user_id>/toggle-active/', super_admin_user_toggle_active_action, name='super_admin_user_toggle_active'),
+    path('users/<int:user_id>/toggle-role/', super_admin_user_toggle_role_action, name='super_admin_user_toggle_role'),
+    path('learning/', super_admin_learning_view, name='super_admin_learning'),
+    path('course-list/', super_admin_course_list_view, name='super_admin_course_list'),
+    path('course-list/<int:course_id>/', super_admin_course_view, name='super_admin_course_view'),
+    path('learning/courses/new/', super_admin_learning_course_create_view, name='super_admin_learning_course_create_view'),
+    path('learning/courses/<int:course_id>/edit/', super_admin_course_edit_view, name='super_admin_course_edit_view'),
+    path('learning/course-business-assignments/', super_admin_course_business_assignments_view, name='super_admin_course_business_assignments'),
+    path('learning/content/new/', super_admin_learning_content_create_view, name='super_admin_learning_content_create_view'),
+    path('learning/exams/templates/', super_admin_exam_templates_view, name='super_admin_exam_templates'),
+    path('learning/exams/templates/create/', super_admin_exam_template_editor_view, name='super_admin_exam_template_create'),
+    path('learning/exams/templates/<int:template_id>/', super_admin_exam_template_editor_view, name='super_admin_exam_template_editor'),
+    path('learning/exams/templates/<int:template_id>/questions/create/', super_admin_exam_question_editor_view, name='super_admin_exam_question_create'),
+    path('learning/exams/templates/<int:template_id>/questions/<int:question_id>/', super_admin_exam_question_editor_view, name='super_admin_exam_question_editor'),
+    path('learning/exams/templates/<int:template_id>/questions/<int:question_id>/delete/', super_admin_exam_question_delete_action, name='super_admin_exam_question_delete'),
+    path('learning/exams/sessions/', super_admin_exam_sessions_view, name='super_admin_exam_sessions'),
+    path('learning/exams/grading/', super_admin_exam_grading_view, name='super_admin_exam_grading'),
+    path('learning/courses/create/', super_admin_course_create_action, name='super_admin_course_create'),
+    path('learning/courses/<int:course_id>/update/', super_admin_course_update_action, name='super_admin_course_update'),
+    path('learning/course-business-assignments/save/', super_admin_course_business_assignments_action, name='super_admin_course_business_assignments_save'),
+    path('learning/course-content/create/', super_admin_course_content_create_action, name='super_admin_course_content_create'),
+    path('learning/courses/<int:course_id>/toggle/', super_admin_course_toggle_action, name='super_admin_course_toggle'),
+    path('learning/checklists/<int:checklist_id>/toggle/', super_admin_checklist_toggle_action, name='super_admin_checklist_toggle'),
+    path('operations/', super_admin_operations_view, name='super_admin_operations'),
+    path('scorm/', super_admin_scorm_library_view, name='super_admin_scorm'),
+]
+
+business_owner_patterns = [
+    path('dashboard/', business_owner_dashboard_view, name='business_owner_dashboard'),
+    path('dashboard/employees/<int:employee_id>/delete/', business_owner_dashboard_delete_employee_action, name='business_owner_dashboard_delete_employee'),
+    path('dashboard/employees/<int:employee_id>/assign-course/', business_owner_dashboard_assign_course_action, name='business_owner_dashboard_assign_course'),
+    path('employees/', business_owner_employees_view, name='business_owner_employees'),
+    path('job-titles/', business_owner_job_titles_view, name='business_owner_job_titles'),
+    path('courses/', business_owner_courses_view, name='business_owner_courses'),
+    path('course-list/', business_owner_course_list_view, name='business_owner_course_list'),
+    path('course-list/<int:course_id>/', business_owner_course_view, name='business_owner_course_view'),
+    path('course-list/<int:course_id>/assign-employees/', business_owner_course_assign_employees_action, name='business_owner_course_assign_employees'),
+    path('course-content/', business_owner_course_content_view, name='business_owner_course_content'),
+    path('checklists/', business_owner_checklists_view, name='business_owner_checklists'),
+    path('chat/', business_owner_chat_view, name='business_owner_chat'),
+    path('chat/private/', business_owner_private_chat_view, name='business_owner_private_chat'),
+    path('chat/send/', business_owner_chat_send_action, name='business_owner_chat_send'),
+    path('chat/private/send/', business_owner_private_chat_send_action, name='business_owner_private_chat_send'),
+    path('reports/', business_owner_reports_view, name='business_owner_reports'),
+    path('scorm/', business_owner_scorm_library_view, name='business_owner_scorm'),
+    path('job-titles/create/', business_owner_job_title_create_action, name='business_owner_job_title_create'),
+    path('employees/create/', business_owner_employee_create_action, name='business_owner_employee_create'),
+    path('courses/create/', business_owner_course_create_action, name='business_owner_course_create'),
+    path('course-content/create/', business_owner_course_content_create_action, name='business_owner_course_content_create'),
+    path('course-content/<int:item_id>/update/', business_owner_course_content_update_action, name='business_owner_course_content_update'),
+    path('course-content/<int:item_id>/delete/', business_owner_course_content_delete_action, name='business_owner_course_content_delete'),
+    path('checklists/create/', business_owner_checklist_create_action, name='business_owner_checklist_create'),
+    path('checklist-rules/create/', business_owner_checklist_assignment_rule_create_action, name='business_owner_checklist_rule_create'),
+]
+
+employee_patterns = [
+    path('dashboard/', employee_dashboard_view, name='employee_dashboard'),
+    path('chat/', employee_chat_view, name='employee_chat'),
+    path('chat/private/', employee_private_chat_view, name='employee_private_chat'),
+    path('chat/send/', employee_chat_send_action, name='employee_chat_send'),
+    path('chat/private/send/', employee_private_chat_send_action, name='employee_private_chat_send'),
+    path('courses/', employee_courses_view, name='employee_courses'),
+    path('learning-history/', employee_learning_history_view, name='employee_learning_history'),
+    path('courses/<int:assignment_id>/', employee_course_view, name='employee_course_view'),
+    path('courses/<int:assignment_id>/exam/', employee_course_exam_view, name='employee_course_exam'),
+    path('courses/<int:assignment_id>/exam/take/', employee_course_exam_take_view, name='employee_course_exam_take'),
+    path('courses/<int:assignment_id>/exam/submit/', employee_course_exam_submit_action, name='employee_course_exam_submit'),
+    path('checklists/', employee_checklists_view, name='employee_checklists'),
+    path('scorm/', employee_scorm_courses_view, name='employee_scorm_courses'),
+    path('scorm/<str:filename>/', employee_scorm_course_view, name='employee_scorm_course_view'),
+    path('scorm/<str:filename>/check-complete/', employee_scorm_check_complete_action, name='employee_scorm_check_complete_action'),
+    path('courses/<int:assignment_id>/complete/', employee_course_complete_action, name='employee_course_complete'),
+    path('checklists/<int:checklist_id>/', employee_checklist_detail_view, name='employee_checklist_detail'),
+    path('checklists/<int:checklist_id>/complete/', employee_checklist_complete_action, name='employee_checklist_complete'),
+]
+
+scorm_player_patterns = [
+    path('<str:folder>/<path:filepath>', scorm_player_file_view, name='scorm_player_file'),
+    path('<str:folder>/<path:filepath>/', scorm_player_file_redirect_view, name='scorm_player_file_slash_redirect'),
+]
+
 urlpatterns = [
     path('', home_view, name='home'),
     path('register/', register_view, name='register'),
     path('login/', login_view, name='login'),
     path('logout/', logout_view, name='logout'),
-    path('super-admin/dashboard/', super_admin_dashboard_view, name='super_admin_dashboard'),
-    path('super-admin/businesses/', super_admin_businesses_view, name='super_admin_businesses'),
-    path('super-admin/businesses/new/', super_admin_business_create_view, name='super_admin_business_create_view'),
-    path('super-admin/businesses/create/', super_admin_business_create_action, name='super_admin_business_create'),
-    path('super-admin/businesses/<int:business_id>/toggle/', super_admin_business_toggle_action, name='super_admin_business_toggle'),
-    path('super-admin/users/', super_admin_users_view, name='super_admin_users'),
-    path('super-admin/users/new/', super_admin_user_create_view, name='super_admin_user_create_view'),
-    path('super-admin/users/grant-role/', super_admin_user_role_grant_view, name='super_admin_user_role_grant_view'),
-    path('super-admin/users/create/', super_admin_user_create_action, name='super_admin_user_create'),
-    path('super-admin/users/grant-role/submit/', super_admin_user_role_grant_action, name='super_admin_user_role_grant'),
-    path('super-admin/users/<int:user_id>/toggle-active/', super_admin_user_toggle_active_action, name='super_admin_user_toggle_active'),
-    path('super-admin/users/<int:user_id>/toggle-role/', super_admin_user_toggle_role_action, name='super_admin_user_toggle_role'),
-    path('super-admin/learning/', super_admin_learning_view, name='super_admin_learning'),
-    path('super-admin/course-list/', super_admin_course_list_view, name='super_admin_course_list'),
-    path('super-admin/course-list/<int:course_id>/', super_admin_course_view, name='super_admin_course_view'),
-    path('super-admin/learning/courses/new/', super_admin_learning_course_create_view, name='super_admin_learning_course_create_view'),
-    path('super-admin/learning/courses/<int:course_id>/edit/', super_admin_course_edit_view, name='super_admin_course_edit_view'),
-    path('super-admin/learning/course-business-assignments/', super_admin_course_business_assignments_view, name='super_admin_course_business_assignments'),
-    path('super-admin/learning/content/new/', super_admin_learning_content_create_view, name='super_admin_learning_content_create_view'),
-    path('super-admin/learning/exams/templates/', super_admin_exam_templates_view, name='super_admin_exam_templates'),
-    path('super-admin/learning/exams/templates/create/', super_admin_exam_template_editor_view, name='super_admin_exam_template_create'),
-    path('super-admin/learning/exams/templates/<int:template_id>/', super_admin_exam_template_editor_view, name='super_admin_exam_template_editor'),
-    path('super-admin/learning/exams/templates/<int:template_id>/questions/create/', super_admin_exam_question_editor_view, name='super_admin_exam_question_create'),
-    path('super-admin/learning/exams/templates/<int:template_id>/questions/<int:question_id>/', super_admin_exam_question_editor_view, name='super_admin_exam_question_editor'),
-    path('super-admin/learning/exams/templates/<int:template_id>/questions/<int:question_id>/delete/', super_admin_exam_question_delete_action, name='super_admin_exam_question_delete'),
-    path('super-admin/learning/exams/sessions/', super_admin_exam_sessions_view, name='super_admin_exam_sessions'),
-    path('super-admin/learning/exams/grading/', super_admin_exam_grading_view, name='super_admin_exam_grading'),
-    path('super-admin/learning/courses/create/', super_admin_course_create_action, name='super_admin_course_create'),
-    path('super-admin/learning/courses/<int:course_id>/update/', super_admin_course_update_action, name='super_admin_course_update'),
-    path('super-admin/learning/course-business-assignments/save/', super_admin_course_business_assignments_action, name='super_admin_course_business_assignments_save'),
-    path('super-admin/learning/course-content/create/', super_admin_course_content_create_action, name='super_admin_course_content_create'),
-    path('super-admin/learning/courses/<int:course_id>/toggle/', super_admin_course_toggle_action, name='super_admin_course_toggle'),
-    path('super-admin/learning/checklists/<int:checklist_id>/toggle/', super_admin_checklist_toggle_action, name='super_admin_checklist_toggle'),
-    path('super-admin/operations/', super_admin_operations_view, name='super_admin_operations'),
-    path('super-admin/scorm/', super_admin_scorm_library_view, name='super_admin_scorm'),
-    path('business-owner/dashboard/', business_owner_dashboard_view, name='business_owner_dashboard'),
-    path('business-owner/dashboard/employees/<int:employee_id>/delete/', business_owner_dashboard_delete_employee_action, name='business_owner_dashboard_delete_employee'),
-    path('business-owner/dashboard/employees/<int:employee_id>/assign-course/', business_owner_dashboard_assign_course_action, name='business_owner_dashboard_assign_course'),
-    path('business-owner/employees/', business_owner_employees_view, name='business_owner_employees'),
-    path('business-owner/job-titles/', business_owner_job_titles_view, name='business_owner_job_titles'),
-    path('business-owner/courses/', business_owner_courses_view, name='business_owner_courses'),
-    path('business-owner/course-list/', business_owner_course_list_view, name='business_owner_course_list'),
-    path('business-owner/course-list/<int:course_id>/', business_owner_course_view, name='business_owner_course_view'),
-    path('business-owner/course-list/<int:course_id>/assign-employees/', business_owner_course_assign_employees_action, name='business_owner_course_assign_employees'),
-    path('business-owner/course-content/', business_owner_course_content_view, name='business_owner_course_content'),
-    path('business-owner/checklists/', business_owner_checklists_view, name='business_owner_checklists'),
-    path('business-owner/chat/', business_owner_chat_view, name='business_owner_chat'),
-    path('business-owner/chat/private/', business_owner_private_chat_view, name='business_owner_private_chat'),
-    path('business-owner/chat/send/', business_owner_chat_send_action, name='business_owner_chat_send'),
-    path('business-owner/chat/private/send/', business_owner_private_chat_send_action, name='business_owner_private_chat_send'),
-    path('business-owner/reports/', business_owner_reports_view, name='business_owner_reports'),
-    path('business-owner/scorm/', business_owner_scorm_library_view, name='business_owner_scorm'),
-    path('business-owner/job-titles/create/', business_owner_job_title_create_action, name='business_owner_job_title_create'),
-    path('business-owner/employees/create/', business_owner_employee_create_action, name='business_owner_employee_create'),
-    path('business-owner/courses/create/', business_owner_course_create_action, name='business_owner_course_create'),
-    path('business-owner/course-content/create/', business_owner_course_content_create_action, name='business_owner_course_content_create'),
-    path('business-owner/course-content/<int:item_id>/update/', business_owner_course_content_update_action, name='business_owner_course_content_update'),
-    path('business-owner/course-content/<int:item_id>/delete/', business_owner_course_content_delete_action, name='business_owner_course_content_delete'),
-    path('business-owner/checklists/create/', business_owner_checklist_create_action, name='business_owner_checklist_create'),
-    path('business-owner/checklist-rules/create/', business_owner_checklist_assignment_rule_create_action, name='business_owner_checklist_rule_create'),
-    path('employee/dashboard/', employee_dashboard_view, name='employee_dashboard'),
-    path('employee/chat/', employee_chat_view, name='employee_chat'),
-    path('employee/chat/private/', employee_private_chat_view, name='employee_private_chat'),
-    path('employee/chat/send/', employee_chat_send_action, name='employee_chat_send'),
-    path('employee/chat/private/send/', employee_private_chat_send_action, name='employee_private_chat_send'),
-    path('employee/courses/', employee_courses_view, name='employee_courses'),
-    path('employee/learning-history/', employee_learning_history_view, name='employee_learning_history'),
-    path('employee/courses/<int:assignment_id>/', employee_course_view, name='employee_course_view'),
-    path('employee/courses/<int:assignment_id>/exam/', employee_course_exam_view, name='employee_course_exam'),
-    path('employee/courses/<int:assignment_id>/exam/take/', employee_course_exam_take_view, name='employee_course_exam_take'),
-    path('employee/courses/<int:assignment_id>/exam/submit/', employee_course_exam_submit_action, name='employee_course_exam_submit'),
-    path('employee/checklists/', employee_checklists_view, name='employee_checklists'),
-    path('employee/scorm/', employee_scorm_courses_view, name='employee_scorm_courses'),
-    path('employee/scorm/<str:filename>/', employee_scorm_course_view, name='employee_scorm_course_view'),
-    path('employee/scorm/<str:filename>/check-complete/', employee_scorm_check_complete_action, name='employee_scorm_check_complete_action'),
-    path('employee/courses/<int:assignment_id>/complete/', employee_course_complete_action, name='employee_course_complete'),
-    path('employee/checklists/<int:checklist_id>/', employee_checklist_detail_view, name='employee_checklist_detail'),
-    path('employee/checklists/<int:checklist_id>/complete/', employee_checklist_complete_action, name='employee_checklist_complete'),
-    path('scorm/player/<str:folder>/<path:filepath>', scorm_player_file_view, name='scorm_player_file'),
-    path('scorm/player/<str:folder>/<path:filepath>/', scorm_player_file_redirect_view, name='scorm_player_file_slash_redirect'),
+    path('super-admin/', include(super_admin_patterns)),
+    path('business-owner/', include(business_owner_patterns)),
+    path('employee/', include(employee_patterns)),
+    path('scorm/player/', include(scorm_player_patterns)),
 ]
@@ -111,7 +111,7 @@ class BusinessOwnerEmployeeCreateForm(BusinessEmployeeCreateForm):
 
 
 def _is_business_owner(user) -> bool:
-    return bool(user and user.is_authenticated and BusinessTenant.objects.filter(owner=user, is_active=True).exists())
+    return bool(user and user.is_authenticated and _get_owned_business(user) is not None)
 
 
 def _is_super_admin(user) -> bool:
@@ -129,7 +129,7 @@ def _is_employee(user) -> bool:
         and user.is_authenticated
         and not _is_super_admin(user)
         and not _is_business_owner(user)
-        and EmployeeProfile.objects.filter(user=user, is_active=True, business__is_active=True).exists()
+        and _get_employee_profile(user) is not None
     )
 
 
@@ -317,12 +317,22 @@ def _primary_dashboard_route(user):
     return 'home'
 
 
+# Role guards, views and the chat context processor all ask for these on the
+# same request; the user object only lives for one request, so memoize on it.
 def _get_owned_business(user):
-    return BusinessTenant.objects.filter(owner=user, is_active=True).first()
+    if not hasattr(user, '_owned_business_cache'):
+        user._owned_business_cache = BusinessTenant.objects.filter(owner=user, is_active=True).first()
+    return user._owned_business_cache
 
 
 def _get_employee_profile(user):
-    return EmployeeProfile.objects.select_related('business', 'job_title', 'user').filter(user=user, is_active=True, business__is_active=True).first()
+    if not hasattr(user, '_employee_profile_cache'):
+        user._employee_profile_cache = (
+            EmployeeProfile.objects.select_related('business', 'job_title', 'user')
+            .filter(user=user, is_active=True, business__is_active=True)
+            .first()
+        )
+    return user._employee_profile_cache
 
 
 def _get_business_employee_profile(business, employee_id: int):
@@ -680,6 +690,24 @@ def _assign_course_to_employee(*, business, course, employee_profile, assigned_b
     return False, 'هذه الدورة مدرجة بالفعل لهذا الموظف.'
 
 
+def _assign_course_to_employees(*, business, course, employee_profiles, assigned_by) -> tuple[int, int]:
+    employee_ids = {profile.user_id for profile in employee_profiles}
+    assigned_employee_ids = set(
+        CourseAssignment.objects.filter(course=course, employee_id__in=employee_ids).values_list('employee_id', flat=True)
+    )
+    new_assignments = [
+        CourseAssignment(
+            business=business,
+            course=course,
+            employee_id=employee_id,
+            assigned_by=assigned_by,
+        )
+        for employee_id in sorted(employee_ids - assigned_employee_ids)
+    ]
+    CourseAssignment.objects.bulk_create(new_assignments, ignore_conflicts=True)
+    return len(new_assignments), len(employee_profiles) - len(new_assignments)
+
+
 EMPLOYEE_COURSE_CATALOG_PATH = Path(settings.BASE_DIR) / 'accounts' / 'data' / 'employee_course_catalog.json'
 
 
@@ -996,6 +1024,15 @@ def _assigned_checklists_queryset(employee_profile):
     return queryset
 
 
+def _mark_checklist_items_checked(completion, items) -> None:
+    SOPChecklistItemCompletion.objects.bulk_create(
+        [SOPChecklistItemCompletion(completion=completion, item=item, is_checked=True) for item in items],
+        update_conflicts=True,
+        unique_fields=['completion', 'item'],
+        update_fields=['is_checked', 'checked_at'],
+    )
+
+
 def _display_name(user) -> str:
     full_name = f'{getattr(user, "first_name", "")} {getattr(user, "last_name", "")}'.strip()
     return full_name or getattr(user, 'username', 'User')
@@ -1378,7 +1415,7 @@ def _issue_course_exam_certificate(user, course) -> tuple[str | None, str | None
                 ContentFile(pdf_bytes),
                 save=False,
             )
-            cert.save()
+            cert.save(update_fields=['pdf_file'])
         except Exception:
             return None, 'تم إنهاء الاختبار، لكن تعذر إنشاء ملف الشهادة الآن.'
     return _certificate_file_url(cert.pdf_file), None
@@ -2695,19 +2732,12 @@ def business_owner_course_assign_employees_action(request, course_id: int):
         messages.error(request, 'تعذر العثور على الموظفين المحددين')
         return redirect('business_owner_course_view', course_id=course.id)
 
-    created_count = 0
-    duplicate_count = 0
-    for employee in selected_profiles:
-        created, _ = _assign_course_to_employee(
-            business=business,
-            course=course,
-            employee_profile=employee,
-            assigned_by=request.user,
-        )
-        if created:
-            created_count += 1
-        else:
-            duplicate_count += 1
+    created_count, duplicate_count = _assign_course_to_employees(
+        business=business,
+        course=course,
+        employee_profiles=selected_profiles,
+        assigned_by=request.user,
+    )
 
     if created_count and duplicate_count:
         messages.success(request, f'تم إدراج الدورة "{course.title}" إلى {created_count} موظف/موظفين. وتم ترك {duplicate_count} كما هي لأنها مدرجة بالفعل وتظهر في لوحة الموظف')
@@ -3312,8 +3342,7 @@ def employee_checklist_complete_action(request, checklist_id: int):
     if not created:
         completion.notes = (request.POST.get('notes') or '').strip()
         completion.save(update_fields=['notes'])
-    for item in items:
-        SOPChecklistItemCompletion.objects.update_or_create(completion=completion, item=item, defaults={'is_checked': True})
+    _mark_checklist_items_checked(completion, items)
     messages.success(request, 'تم اكمال المهام اليومية')
     return redirect(redirect_target)
 
@@ -3367,7 +3396,7 @@ def employee_scorm_check_complete_action(request, filename: str):
         try:
             pdf_bytes = _generate_certificate_pdf_bytes(owner_name=_display_name(request.user), course_name=course_name, verification_code=cert.verification_code, issued_at=getattr(cert, 'issued_at', None) or timezone.now())
             cert.pdf_file.save(f'scorm_certificate_{request.user.id}_{cert.verification_code}.pdf', ContentFile(pdf_bytes), save=False)
-            cert.save()
+            cert.save(update_fields=['pdf_file'])
             certificate_url = _certificate_file_url(cert.pdf_file)
         except Exception:
             certificate_error = 'تم تسجيل الإكمال، لكن تعذر إنشاء ملف PDF الآن. حاول لاحقاً.'
@@ -6,4 +6,6 @@ from .models import ScormCertificate
 @admin.register(ScormCertificate)
 class ScormCertificateAdmin(admin.ModelAdmin):
     list_display = ('owner', 'course_name', 'issued_at', 'expires_at', 'verification_code')
+    list_select_related = ('owner',)
     search_fields = ('course_name', 'scorm_filename', 'verification_code')
+    autocomplete_fields = ('owner',)
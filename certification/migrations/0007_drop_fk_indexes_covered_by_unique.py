@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-15 13:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('certification', '0006_delete_certificate'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='scormcertificate',
+            name='owner',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='scorm_certificates', to=settings.AUTH_USER_MODEL, verbose_name='Beneficiary'),
+        ),
+    ]
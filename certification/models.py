@@ -13,6 +13,7 @@ class ScormCertificate(models.Model):
         User,
         on_delete=models.CASCADE,
         related_name='scorm_certificates',
+        db_index=False,
         verbose_name='Beneficiary',
     )
     course_name = models.CharField(
@@ -85,4 +86,7 @@ class ScormCertificate(models.Model):
 
         if not self.expires_at:
             self.expires_at = self._compute_expires_at()
+            update_fields = kwargs.get('update_fields')
+            if self.expires_at and update_fields is not None and 'expires_at' not in update_fields:
+                kwargs['update_fields'] = [*update_fields, 'expires_at']
         super().save(*args, **kwargs)
@@ -1,5 +1,7 @@
 from django.contrib import admin
 
+from accounts.admin import JobTitleListFilter
+
 from .models import (
     Course,
     CourseAssignment,
@@ -12,62 +14,130 @@ from .models import (
 )
 
 
+def _admin_url_name(request) -> str:
+    match = getattr(request, 'resolver_match', None)
+    return (match.url_name or '') if match else ''
+
+
+class DeferLargeFieldsMixin:
+    # Changelists and autocomplete results only render short columns, so the
+    # large TextFields are left out of their SELECT. Change forms still load them.
+    list_deferred_fields = ()
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        url_name = _admin_url_name(request)
+        if self.list_deferred_fields and (url_name.endswith('_changelist') or url_name == 'autocomplete'):
+            queryset = queryset.defer(*self.list_deferred_fields)
+        return queryset
+
+
+class TitlePrefixAutocompleteMixin:
+    # Autocomplete matches the whole term as a title prefix. The UPPER(title)
+    # pattern index from migration 0030 can serve that, but not the changelist
+    # search, which ORs each word across columns of joined tables.
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if search_term and _admin_url_name(request) == 'autocomplete':
+            return queryset.filter(title__istartswith=search_term), False
+        return super().get_search_results(request, queryset, search_term)
+
+
 class CourseContentItemInline(admin.TabularInline):
     model = CourseContentItem
     extra = 0
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('course')
+
 
 @admin.register(Course)
-class CourseAdmin(admin.ModelAdmin):
+class CourseAdmin(TitlePrefixAutocompleteMixin, DeferLargeFieldsMixin, admin.ModelAdmin):
     list_display = ('title', 'business', 'estimated_minutes', 'is_active', 'created_by')
+    list_select_related = ('business', 'created_by')
+    list_deferred_fields = ('description',)
     search_fields = ('title', 'business__name')
     list_filter = ('business', 'is_active')
+    autocomplete_fields = ('business', 'created_by')
     inlines = [CourseContentItemInline]
 
 
 @admin.register(CourseContentItem)
-class CourseContentItemAdmin(admin.ModelAdmin):
+class CourseContentItemAdmin(DeferLargeFieldsMixin, admin.ModelAdmin):
     list_display = ('title', 'course', 'content_type', 'order', 'updated_at')
+    list_select_related = ('course',)
+    list_deferred_fields = ('body', 'course__description')
     search_fields = ('title', 'course__title', 'course__business__name')
     list_filter = ('content_type', 'course__business')
+    autocomplete_fields = ('course',)
 
 
 @admin.register(CourseAssignment)
-class CourseAssignmentAdmin(admin.ModelAdmin):
+class CourseAssignmentAdmin(DeferLargeFieldsMixin, admin.ModelAdmin):
     list_display = ('employee', 'business', 'course', 'status', 'assigned_at', 'completed_at')
+    list_select_related = ('employee', 'business', 'course')
+    list_deferred_fields = ('course__description',)
     search_fields = ('employee__username', 'business__name', 'course__title')
     list_filter = ('business', 'status')
+    autocomplete_fields = ('business', 'course', 'employee', 'assigned_by')
 
 
 class SOPChecklistItemInline(admin.TabularInline):
     model = SOPChecklistItem
     extra = 0
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('checklist')
+
 
 @admin.register(SOPChecklist)
-class SOPChecklistAdmin(admin.ModelAdmin):
+class SOPChecklistAdmin(TitlePrefixAutocompleteMixin, DeferLargeFieldsMixin, admin.ModelAdmin):
     list_display = ('title', 'business', 'frequency', 'is_active', 'created_by')
+    list_select_related = ('business', 'created_by')
+    list_deferred_fields = ('description',)
     search_fields = ('title', 'business__name')
     list_filter = ('business', 'frequency', 'is_active')
+    autocomplete_fields = ('business', 'created_by')
     inlines = [SOPChecklistItemInline]
 
 
 @admin.register(SOPChecklistAssignmentRule)
-class SOPChecklistAssignmentRuleAdmin(admin.ModelAdmin):
+class SOPChecklistAssignmentRuleAdmin(DeferLargeFieldsMixin, admin.ModelAdmin):
     list_display = ('business', 'job_title', 'checklist', 'assigned_by', 'created_at')
+    list_select_related = ('business', 'job_title__business', 'checklist', 'assigned_by')
+    list_deferred_fields = ('checklist__description',)
     search_fields = ('business__name', 'job_title__name', 'checklist__title')
-    list_filter = ('business', 'job_title')
+    list_filter = ('business', ('job_title', JobTitleListFilter))
+    autocomplete_fields = ('business', 'job_title', 'checklist', 'assigned_by')
 
 
 @admin.register(SOPChecklistCompletion)
-class SOPChecklistCompletionAdmin(admin.ModelAdmin):
+class SOPChecklistCompletionAdmin(DeferLargeFieldsMixin, admin.ModelAdmin):
     list_display = ('employee', 'business', 'checklist', 'completed_for', 'completed_at')
+    list_select_related = ('employee', 'business', 'checklist')
+    list_deferred_fields = ('notes', 'checklist__description')
     search_fields = ('employee__username', 'business__name', 'checklist__title')
     list_filter = ('business', 'completed_for')
+    autocomplete_fields = ('business', 'checklist', 'employee')
+
+    def get_queryset(self, request):
+        # SOPChecklistCompletion.__str__ renders the employee and checklist, which
+        # the item completion autocomplete results show too. The changelist skips
+        # list_select_related once joins are set here, so join all of them.
+        return super().get_queryset(request).select_related(*self.list_select_related)
 
 
 @admin.register(SOPChecklistItemCompletion)
-class SOPChecklistItemCompletionAdmin(admin.ModelAdmin):
+class SOPChecklistItemCompletionAdmin(DeferLargeFieldsMixin, admin.ModelAdmin):
     list_display = ('completion', 'item', 'is_checked', 'checked_at')
+    list_select_related = ('completion__employee', 'completion__checklist', 'item__checklist')
+    list_deferred_fields = ('completion__notes', 'completion__checklist__description', 'item__checklist__description')
     search_fields = ('completion__employee__username', 'item__title')
     list_filter = ('is_checked',)
+    autocomplete_fields = ('completion',)
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'item':
+            # SOPChecklistItem.__str__ includes the checklist title.
+            kwargs['queryset'] = SOPChecklistItem.objects.select_related('checklist')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.1 on 2026-10-15 09:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_teamchatreadreceipt_privatechatthread_and_more'),
+        ('training', '0028_alter_courseassignment_status'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['business', 'is_active', 'title'], name='course_biz_active_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='courseassignment',
+            index=models.Index(fields=['business', 'status', '-assigned_at'], name='assignment_biz_status_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='coursecontentitem',
+            index=models.Index(fields=['course', 'order'], name='content_item_course_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sopchecklist',
+            index=models.Index(fields=['business', 'is_active', 'title'], name='sop_checklist_biz_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sopchecklistcompletion',
+            index=models.Index(fields=['business', '-completed_for', '-completed_at'], name='sop_completion_biz_date_idx'),
+        ),
+    ]
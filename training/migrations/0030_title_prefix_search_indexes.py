@@ -0,0 +1,41 @@
+from django.db import migrations
+
+
+# Admin autocomplete searches titles with istartswith, which PostgreSQL runs as
+# UPPER("title"::text) LIKE UPPER('term%'). Only an expression index using the
+# pattern operator class can serve that prefix match, and SQLite has no
+# equivalent, so these are created on PostgreSQL only.
+TITLE_PREFIX_INDEXES = (
+    ('course_title_upper_like_idx', 'training_course'),
+    ('sop_checklist_title_upper_like_idx', 'training_sopchecklist'),
+)
+
+
+def create_title_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, table_name in TITLE_PREFIX_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} (UPPER(title::text) text_pattern_ops)'
+        )
+
+
+def drop_title_prefix_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for index_name, _table_name in TITLE_PREFIX_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {index_name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('training', '0029_admin_filter_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_title_prefix_indexes,
+            reverse_code=drop_title_prefix_indexes,
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 6.0.1 on 2026-10-15 11:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_teamchatreadreceipt_privatechatthread_and_more'),
+        ('training', '0030_title_prefix_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='course',
+            name='business',
+            field=models.ForeignKey(blank=True, db_index=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='courses', to='accounts.businesstenant', verbose_name='Business'),
+        ),
+        migrations.AlterField(
+            model_name='courseassignment',
+            name='business',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='course_assignments', to='accounts.businesstenant', verbose_name='Business'),
+        ),
+        migrations.AlterField(
+            model_name='coursecontentitem',
+            name='course',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='content_items', to='training.course', verbose_name='Course'),
+        ),
+        migrations.AlterField(
+            model_name='sopchecklist',
+            name='business',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='sop_checklists', to='accounts.businesstenant', verbose_name='Business'),
+        ),
+        migrations.AlterField(
+            model_name='sopchecklistcompletion',
+            name='business',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='sop_completions', to='accounts.businesstenant', verbose_name='Business'),
+        ),
+    ]
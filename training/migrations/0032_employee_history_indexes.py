@@ -0,0 +1,35 @@
+# Generated by Django 6.0.1 on 2026-10-15 12:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0012_teamchatreadreceipt_privatechatthread_and_more'),
+        ('training', '0031_drop_fk_indexes_covered_by_composites'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='courseassignment',
+            name='employee',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='course_assignments', to=settings.AUTH_USER_MODEL, verbose_name='Employee'),
+        ),
+        migrations.AlterField(
+            model_name='sopchecklistcompletion',
+            name='employee',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='sop_completions', to=settings.AUTH_USER_MODEL, verbose_name='Employee'),
+        ),
+        migrations.AddIndex(
+            model_name='courseassignment',
+            index=models.Index(fields=['employee', 'business', '-assigned_at'], name='assignment_emp_biz_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sopchecklistcompletion',
+            index=models.Index(fields=['employee', '-completed_for', '-completed_at'], name='sop_completion_emp_date_idx'),
+        ),
+    ]
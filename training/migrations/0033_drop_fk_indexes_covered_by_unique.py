@@ -0,0 +1,55 @@
+# Generated by Django 6.0.1 on 2026-10-15 13:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0013_drop_fk_indexes_covered_by_unique'),
+        ('training', '0032_employee_history_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='courseassignment',
+            name='course',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='assignments', to='training.course', verbose_name='Course'),
+        ),
+        migrations.AlterField(
+            model_name='coursebusinessassignment',
+            name='course',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='business_assignments', to='training.course', verbose_name='Course'),
+        ),
+        migrations.AlterField(
+            model_name='examoption',
+            name='question',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='options', to='training.examquestion', verbose_name='Question'),
+        ),
+        migrations.AlterField(
+            model_name='examquestion',
+            name='template',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='questions', to='training.examtemplate', verbose_name='Exam template'),
+        ),
+        migrations.AlterField(
+            model_name='sopchecklistassignmentrule',
+            name='job_title',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='sop_assignment_rules', to='accounts.jobtitle', verbose_name='Job title'),
+        ),
+        migrations.AlterField(
+            model_name='sopchecklistcompletion',
+            name='checklist',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='completions', to='training.sopchecklist', verbose_name='Checklist'),
+        ),
+        migrations.AlterField(
+            model_name='sopchecklistitem',
+            name='checklist',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='items', to='training.sopchecklist', verbose_name='Checklist'),
+        ),
+        migrations.AlterField(
+            model_name='sopchecklistitemcompletion',
+            name='completion',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='item_completions', to='training.sopchecklistcompletion', verbose_name='Completion'),
+        ),
+    ]
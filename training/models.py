@@ -15,6 +15,7 @@ class Course(models.Model):
         'accounts.BusinessTenant',
         on_delete=models.CASCADE,
         related_name='courses',
+        db_index=False,
         verbose_name='Business',
         null=True,
         blank=True,
@@ -61,6 +62,9 @@ class Course(models.Model):
         verbose_name = 'Course'
         verbose_name_plural = 'Courses'
         ordering = ['title', 'id']
+        indexes = [
+            models.Index(fields=['business', 'is_active', 'title'], name='course_biz_active_title_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -71,6 +75,7 @@ class CourseBusinessAssignment(models.Model):
         Course,
         on_delete=models.CASCADE,
         related_name='business_assignments',
+        db_index=False,
         verbose_name='Course',
     )
     business = models.ForeignKey(
@@ -114,6 +119,7 @@ class CourseContentItem(models.Model):
         Course,
         on_delete=models.CASCADE,
         related_name='content_items',
+        db_index=False,
         verbose_name='Course',
     )
     content_type = models.CharField(
@@ -165,6 +171,9 @@ class CourseContentItem(models.Model):
         verbose_name = 'Course content item'
         verbose_name_plural = 'Course content items'
         ordering = ['order', 'id']
+        indexes = [
+            models.Index(fields=['course', 'order'], name='content_item_course_order_idx'),
+        ]
 
     def __str__(self):
         return f'{self.course.title} - {self.title}'
@@ -207,18 +216,21 @@ class CourseAssignment(models.Model):
         'accounts.BusinessTenant',
         on_delete=models.CASCADE,
         related_name='course_assignments',
+        db_index=False,
         verbose_name='Business',
     )
     course = models.ForeignKey(
         Course,
         on_delete=models.CASCADE,
         related_name='assignments',
+        db_index=False,
         verbose_name='Course',
     )
     employee = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
         related_name='course_assignments',
+        db_index=False,
         verbose_name='Employee',
     )
     assigned_by = models.ForeignKey(
@@ -249,6 +261,10 @@ class CourseAssignment(models.Model):
         verbose_name = 'Course assignment'
         verbose_name_plural = 'Course assignments'
         ordering = ['-assigned_at', '-id']
+        indexes = [
+            models.Index(fields=['business', 'status', '-assigned_at'], name='assignment_biz_status_date_idx'),
+            models.Index(fields=['employee', 'business', '-assigned_at'], name='assignment_emp_biz_date_idx'),
+        ]
         constraints = [
             models.UniqueConstraint(fields=['course', 'employee'], name='unique_course_assignment_per_employee'),
         ]
@@ -330,6 +346,7 @@ class ExamQuestion(models.Model):
         ExamTemplate,
         on_delete=models.CASCADE,
         related_name='questions',
+        db_index=False,
         verbose_name='Exam template',
     )
     order = models.PositiveIntegerField(
@@ -384,6 +401,7 @@ class ExamOption(models.Model):
         ExamQuestion,
         on_delete=models.CASCADE,
         related_name='options',
+        db_index=False,
         verbose_name='Question',
     )
     order = models.PositiveIntegerField(
@@ -469,6 +487,7 @@ class SOPChecklist(models.Model):
         'accounts.BusinessTenant',
         on_delete=models.CASCADE,
         related_name='sop_checklists',
+        db_index=False,
         verbose_name='Business',
     )
     title = models.CharField(
@@ -507,6 +526,9 @@ class SOPChecklist(models.Model):
         verbose_name = 'SOP checklist'
         verbose_name_plural = 'SOP checklists'
         ordering = ['title', 'id']
+        indexes = [
+            models.Index(fields=['business', 'is_active', 'title'], name='sop_checklist_biz_active_idx'),
+        ]
 
     def __str__(self):
         return self.title
@@ -517,6 +539,7 @@ class SOPChecklistItem(models.Model):
         SOPChecklist,
         on_delete=models.CASCADE,
         related_name='items',
+        db_index=False,
         verbose_name='Checklist',
     )
     title = models.CharField(
@@ -551,6 +574,7 @@ class SOPChecklistAssignmentRule(models.Model):
         'accounts.JobTitle',
         on_delete=models.CASCADE,
         related_name='sop_assignment_rules',
+        db_index=False,
         verbose_name='Job title',
     )
     checklist = models.ForeignKey(
@@ -589,18 +613,21 @@ class SOPChecklistCompletion(models.Model):
         'accounts.BusinessTenant',
         on_delete=models.CASCADE,
         related_name='sop_completions',
+        db_index=False,
         verbose_name='Business',
     )
     checklist = models.ForeignKey(
         SOPChecklist,
         on_delete=models.CASCADE,
         related_name='completions',
+        db_index=False,
         verbose_name='Checklist',
     )
     employee = models.ForeignKey(
         User,
         on_delete=models.CASCADE,
         related_name='sop_completions',
+        db_index=False,
         verbose_name='Employee',
     )
     completed_for = models.DateField(
@@ -621,6 +648,10 @@ class SOPChecklistCompletion(models.Model):
         verbose_name = 'SOP checklist completion'
         verbose_name_plural = 'SOP checklist completions'
         ordering = ['-completed_for', '-completed_at', '-id']
+        indexes = [
+            models.Index(fields=['business', '-completed_for', '-completed_at'], name='sop_completion_biz_date_idx'),
+            models.Index(fields=['employee', '-completed_for', '-completed_at'], name='sop_completion_emp_date_idx'),
+        ]
         constraints = [
             models.UniqueConstraint(fields=['checklist', 'employee', 'completed_for'], name='unique_daily_sop_completion'),
         ]
@@ -634,6 +665,7 @@ class SOPChecklistItemCompletion(models.Model):
         SOPChecklistCompletion,
         on_delete=models.CASCADE,
         related_name='item_completions',
+        db_index=False,
         verbose_name='Completion',
     )
     item = models.ForeignKey(